@@ -27,6 +27,10 @@ class DatabaseConfig(BaseModel):
     pool_timeout: int = 30
     pool_recycle: int = 3600
     pool_pre_ping: bool = True
+    # 是否持久化 LangGraph 每个节点的执行状态（单次翻译不会恢复或回溯，默认关闭）
+    checkpoint_enabled: bool = False
+    checkpoint_pool_min_size: int = 2
+    checkpoint_pool_max_size: int = 16
 
     def build_url(self) -> str:
         """构建数据库连接 URL（SQLAlchemy 格式）"""
@@ -45,6 +49,9 @@ class DashScopeConfig(BaseModel):
     temperature: float = 0.7
     max_tokens: int = 4096
     request_timeout: int = 60
+    # 短文本先用草稿模型翻译，由主模型打分校验，低于阈值时回退主模型；留空则不启用
+    draft_model_name: str = ""
+    draft_score_threshold: float = 0.8
 
 
 class LLMConfig(BaseModel):
@@ -67,6 +74,16 @@ class RedisConfig(BaseModel):
     health_check_interval: int = 15
 
 
+class CacheConfig(BaseModel):
+    """翻译响应缓存配置"""
+
+    enabled: bool = True
+    max_size: int = 1000
+    ttl: int = 3600
+    semantic_enabled: bool = False
+    semantic_threshold: float = 0.95
+
+
 class LoggingConfig(BaseModel):
     """日志配置"""
 
@@ -91,6 +108,7 @@ class AppConfig(BaseModel):
     server: ServerConfig = Field(default_factory=ServerConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     redis: RedisConfig = Field(default_factory=RedisConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
 
 
 class ConfigManager:
@@ -180,6 +198,11 @@ class ConfigManager:
         """获取 Redis 配置"""
         return self.config.redis
 
+    @property
+    def cache(self) -> CacheConfig:
+        """获取翻译缓存配置"""
+        return self.config.cache
+
 
 # 全局单例
 config_manager = ConfigManager()
@@ -8,9 +8,10 @@
 from dependency_injector import containers, providers
 
 from config import config_manager
+from domain.translate.agent.cache import create_response_cache
 from domain.translate.repository.translate_repository import TranslateRepository
 from domain.translate.service.translate_service import TranslateService
-from llm.dashscope import create_dashscope_llm
+from llm.dashscope import create_dashscope_draft_llm, create_dashscope_llm
 
 
 class AppContainer(containers.DeclarativeContainer):
@@ -20,10 +21,20 @@ class AppContainer(containers.DeclarativeContainer):
 
     llm = providers.Singleton(create_dashscope_llm)
 
+    draft_llm = providers.Singleton(create_dashscope_draft_llm)
+
+    response_cache = providers.Singleton(create_response_cache)
+
     translate_repository = providers.Singleton(TranslateRepository)
 
     translate_service = providers.Singleton(
         TranslateService,
         llm=llm,
+        draft_llm=draft_llm,
         repository=translate_repository,
+        response_cache=response_cache,
+        model_name=config.provided.llm.dashscope.model_name,
+        draft_model_name=config.provided.llm.dashscope.draft_model_name,
+        draft_score_threshold=config.provided.llm.dashscope.draft_score_threshold,
+        enable_checkpointing=config.provided.database.checkpoint_enabled,
     )
@@ -0,0 +1,218 @@
+"""翻译结果缓存
+
+两级缓存：
+1. 精确命中：对规范化后的 (content, direction, context) 计算 SHA256 作为键
+2. 语义命中（可选）：对规范化内容计算本地字符 bigram 向量，与近期条目做余弦相似度比较；
+   bigram 相似度无法区分“30秒”与“90秒”、“支持”与“不支持”，因此还要求两者的数字与否定词完全一致
+
+缓存键带有当前租户前缀，不同租户之间互不可见。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import unicodedata
+from collections import Counter, deque
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from cachetools import TTLCache
+
+from config import config_manager
+from core.context.request import current_realm
+from core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# 语义命中时必须完全一致的片段：数字与否定词，改变它们会改变语义但几乎不影响 bigram 相似度
+_GUARD_RE = re.compile(
+    r"\d+(?:\.\d+)?|[不没无非未别勿否]|\b(?:not|no|never|without)\b|n't",
+    re.IGNORECASE,
+)
+
+
+def canonicalize(text: str | None) -> str:
+    """规范化文本：NFC 归一化、折叠连续空白并去除首尾空白"""
+    if not text:
+        return ""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def _empty_gaps() -> list[dict[str, Any]]:
+    return []
+
+
+def _empty_suggestions() -> list[str]:
+    return []
+
+
+@dataclass
+class CachedTranslation:
+    """缓存的翻译结果"""
+
+    translated_content: str
+    direction: str
+    gaps: list[dict[str, Any]] = field(default_factory=_empty_gaps)
+    suggestions: list[str] = field(default_factory=_empty_suggestions)
+    # 流式模式下 LLM 的原始输出（ReAct 格式），用于回放 content_delta
+    raw_text: str = ""
+    # 生成该结果的模型，回放时写入 translation_start
+    model: str = ""
+
+
+@dataclass
+class _SemanticEntry:
+    """语义索引条目"""
+
+    key: str
+    vector: Counter[str]
+    norm: float
+    guard: tuple[str, ...]
+
+
+def _embed(text: str) -> tuple[Counter[str], float]:
+    """计算文本的字符 bigram 向量及其模长"""
+    if len(text) < 2:
+        vector = Counter(text)
+    else:
+        vector = Counter(text[i : i + 2] for i in range(len(text) - 1))
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return vector, norm
+
+
+def _guard_tokens(text: str) -> tuple[str, ...]:
+    """提取语义命中时必须完全一致的数字与否定词（按出现顺序）"""
+    return tuple(token.lower() for token in _GUARD_RE.findall(text))
+
+
+def _copy_entry(value: CachedTranslation) -> CachedTranslation:
+    """复制缓存条目中的可变字段，避免调用方修改结果时污染缓存"""
+    return replace(
+        value,
+        gaps=[dict(gap) for gap in value.gaps],
+        suggestions=list(value.suggestions),
+    )
+
+
+def _cosine(a: Counter[str], a_norm: float, b: Counter[str], b_norm: float) -> float:
+    """计算两个稀疏向量的余弦相似度"""
+    if not a_norm or not b_norm:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(v * b[k] for k, v in a.items() if k in b)
+    return dot / (a_norm * b_norm)
+
+
+class LLMResponseCache:
+    """LLM 翻译响应缓存（进程内，按租户隔离）"""
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        ttl: int = 3600,
+        semantic_threshold: float | None = None,
+        semantic_window: int = 256,
+    ) -> None:
+        self._entries: TTLCache[str, CachedTranslation] = TTLCache[str, CachedTranslation](maxsize=maxsize, ttl=ttl)
+        self._semantic_threshold = semantic_threshold
+        self._semantic_window = semantic_window
+        # 命名空间与缓存条目同样受容量与 TTL 约束：每个存活的命名空间至少对应一次近期写入
+        self._semantic_index: TTLCache[str, deque[_SemanticEntry]] = TTLCache[str, deque[_SemanticEntry]](
+            maxsize=maxsize, ttl=ttl
+        )
+
+    @staticmethod
+    def _build_key(realm: str, content: str, direction: str, context: str) -> str:
+        """构建精确命中的缓存键"""
+        payload = json.dumps(
+            {"content": content, "direction": direction, "context": context},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{realm}:{digest}"
+
+    @staticmethod
+    def _build_namespace(realm: str, direction: str, context: str) -> str:
+        """构建语义索引的命名空间（只在相同租户、方向与上下文内比较）"""
+        context_digest = hashlib.sha256(context.encode("utf-8")).hexdigest()
+        return f"{realm}:{direction}:{context_digest}"
+
+    def get(self, content: str, direction: str, context: str | None = None) -> CachedTranslation | None:
+        """查询缓存，未命中返回 None"""
+        realm = current_realm()
+        normalized_content = canonicalize(content)
+        normalized_context = canonicalize(context)
+        key = self._build_key(realm, normalized_content, direction, normalized_context)
+
+        if (cached := self._entries.get(key)) is not None:
+            logger.info("翻译缓存精确命中")
+            return _copy_entry(cached)
+
+        if self._semantic_threshold is None:
+            return None
+
+        namespace = self._build_namespace(realm, direction, normalized_context)
+        if not (entries := self._semantic_index.get(namespace)):
+            return None
+
+        vector, norm = _embed(normalized_content)
+        guard = _guard_tokens(normalized_content)
+        for entry in reversed(entries):
+            if entry.guard != guard or _cosine(vector, norm, entry.vector, entry.norm) < self._semantic_threshold:
+                continue
+            if (cached := self._entries.get(entry.key)) is not None:
+                logger.info("翻译缓存语义命中")
+                return _copy_entry(cached)
+        return None
+
+    def put(self, content: str, direction: str, context: str | None, value: CachedTranslation) -> None:
+        """写入缓存"""
+        realm = current_realm()
+        normalized_content = canonicalize(content)
+        normalized_context = canonicalize(context)
+        key = self._build_key(realm, normalized_content, direction, normalized_context)
+        self._entries[key] = _copy_entry(value)
+
+        if self._semantic_threshold is None:
+            return
+
+        namespace = self._build_namespace(realm, direction, normalized_context)
+        entries = self._semantic_index.get(namespace)
+        if entries is None:
+            entries = deque(maxlen=self._semantic_window)
+        # 条目按写入顺序排列，队首已过期或被淘汰的条目直接丢弃
+        while entries and entries[0].key not in self._entries:
+            entries.popleft()
+        # 重新赋值以刷新命名空间的 TTL 与 LRU 位置
+        self._semantic_index[namespace] = entries
+        vector, norm = _embed(normalized_content)
+        entries.append(_SemanticEntry(key=key, vector=vector, norm=norm, guard=_guard_tokens(normalized_content)))
+
+
+def create_response_cache() -> LLMResponseCache | None:
+    """根据配置创建翻译响应缓存，未启用时返回 None"""
+    cache_config = config_manager.cache
+    if not cache_config.enabled:
+        logger.info("翻译响应缓存未启用")
+        return None
+
+    semantic_threshold = cache_config.semantic_threshold if cache_config.semantic_enabled else None
+    logger.info(
+        "翻译响应缓存已启用：容量 %d，TTL %d 秒，语义命中 %s",
+        cache_config.max_size,
+        cache_config.ttl,
+        "开启" if semantic_threshold is not None else "关闭",
+    )
+    return LLMResponseCache(
+        maxsize=cache_config.max_size,
+        ttl=cache_config.ttl,
+        semantic_threshold=semantic_threshold,
+    )
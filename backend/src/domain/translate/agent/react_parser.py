@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any
+from typing import cast
 
 
 @dataclass
@@ -18,139 +18,151 @@ class ReActStep:
     final_answer: str | None = None
 
 
-class ReActParser:
-    """解析 ReAct 格式的响应"""
+# 单个正则按文档顺序匹配所有 ReAct 标记，分组名即步骤字段名
+# "Action Input" 必须排在 "Action" 之前，避免被后者截断
+_MARKER_PATTERN = re.compile(
+    r"(?:(?P<thought>Thought)|(?P<action_input>Action\s+Input)|(?P<action>Action)"
+    r"|(?P<observation>Observation)|(?P<final_answer>Final\s+Answer))\s*:",
+    re.IGNORECASE,
+)
 
-    # 匹配 ReAct 格式的正则表达式
-    THOUGHT_PATTERN = re.compile(r"Thought:\s*(.+?)(?=Action:|Final\s+Answer:|$)", re.DOTALL | re.IGNORECASE)
-    ACTION_PATTERN = re.compile(r"Action:\s*(.+?)(?=Action\s+Input:|$)", re.DOTALL | re.IGNORECASE)
-    ACTION_INPUT_PATTERN = re.compile(r"Action\s+Input:\s*(.+?)(?=Observation:|$)", re.DOTALL | re.IGNORECASE)
-    OBSERVATION_PATTERN = re.compile(r"Observation:\s*(.+?)(?=Thought:|Action:|Final\s+Answer:|$)", re.DOTALL | re.IGNORECASE)
-    FINAL_ANSWER_PATTERN = re.compile(r"Final\s+Answer:\s*(.+?)$", re.DOTALL | re.IGNORECASE)
+# 标记可能被切分在两个 chunk 之间，每次扫描需回看的字符数（覆盖最长的标记）
+_MARKER_LOOKBACK = 32
 
-    @classmethod
-    def parse(cls, text: str) -> list[ReActStep]:
-        """解析完整的 ReAct 格式文本，返回步骤列表"""
-        steps: list[ReActStep] = []
-        current_step = ReActStep()
-
-        # 提取所有匹配的部分
-        text_clean = text.strip()
-
-        # 先查找 Final Answer
-        final_answer_match = cls.FINAL_ANSWER_PATTERN.search(text_clean)
-        if final_answer_match:
-            final_answer = final_answer_match.group(1).strip()
-            current_step.final_answer = final_answer
-
-        # 查找所有 Thought
-        thought_matches = list(cls.THOUGHT_PATTERN.finditer(text_clean))
-        action_matches = list(cls.ACTION_PATTERN.finditer(text_clean))
-        action_input_matches = list(cls.ACTION_INPUT_PATTERN.finditer(text_clean))
-        observation_matches = list(cls.OBSERVATION_PATTERN.finditer(text_clean))
-
-        # 按位置排序所有匹配项
-        all_positions: list[tuple[int, str, str]] = []
-        for m in thought_matches:
-            all_positions.append((m.start(), "thought", m.group(1).strip()))
-        for m in action_matches:
-            all_positions.append((m.start(), "action", m.group(1).strip()))
-        for m in action_input_matches:
-            all_positions.append((m.start(), "action_input", m.group(1).strip()))
-        for m in observation_matches:
-            all_positions.append((m.start(), "observation", m.group(1).strip()))
-
-        all_positions.sort(key=lambda x: x[0])
-
-        # 构建步骤
-        for pos, kind, content in all_positions:
-            if kind == "thought":
-                # 新的思考，可能开始新步骤
-                if current_step.thought or current_step.action:
-                    steps.append(current_step)
-                    current_step = ReActStep()
-                current_step.thought = content
-            elif kind == "action":
-                current_step.action = content
-            elif kind == "action_input":
-                current_step.action_input = content
-            elif kind == "observation":
-                current_step.observation = content
-                # 观察后通常开始新步骤
-                if current_step.thought or current_step.action:
-                    steps.append(current_step)
-                    current_step = ReActStep()
+
+def _final_answer_of(steps: list[ReActStep]) -> str | None:
+    """从步骤列表中取最终答案，没有明确的 Final Answer 时返回最后一步的 observation 或 thought"""
+    if not steps:
+        return None
+    last_step = steps[-1]
+    return last_step.final_answer or last_step.observation or last_step.thought or None
+
+
+class StreamingReActParser:
+    """增量式 ReAct 解析器
+
+    当前片段的文本按 chunk 列表保存，每次 feed 只扫描新到达的文本加上片段末尾的少量回看，
+    片段结束时才拼接一次，整个流的解析代价与文本长度成线性关系。
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._tail = ""
+        self._kind: str | None = None
+        self._current = ReActStep()
+        self._completed: list[ReActStep] = []
+        # 仅在尚未完成任何步骤时保留全文，供 finish 时整体作为最终答案
+        self._chunks: list[str] | None = []
+        self._finished = False
+
+    @property
+    def steps(self) -> list[ReActStep]:
+        """已完成的步骤"""
+        return self._completed
+
+    @property
+    def final_answer(self) -> str | None:
+        """最终答案（应在 finish 之后读取）"""
+        return _final_answer_of(self._completed)
+
+    def feed(self, new_chunk: str) -> list[ReActStep]:
+        """追加文本，返回本次新完成的步骤"""
+        if not new_chunk or self._finished:
+            return []
+        if self._chunks is not None:
+            self._chunks.append(new_chunk)
+        # Final Answer 之后的内容全部视为最终答案，只追加、不再扫描
+        if self._kind == "final_answer":
+            self._parts.append(new_chunk)
+            return []
+
+        completed_before = len(self._completed)
+        window = self._tail + new_chunk
+        text: str | None = None
+        offset = content_start = 0
+        for match in _MARKER_PATTERN.finditer(window):
+            if text is None:
+                # 首次命中标记时才拼接当前片段，offset 为回看窗口在片段中的起点
+                text = "".join(self._parts) + new_chunk
+                offset = len(text) - len(window)
+            if self._kind is not None:
+                self._close_segment(text[content_start : offset + match.start()].strip())
+            self._kind = cast(str, match.lastgroup)
+            content_start = offset + match.end()
+            if self._kind == "final_answer":
+                break
+
+        if text is None:
+            self._parts.append(new_chunk)
+            self._tail = window[-_MARKER_LOOKBACK:]
+        else:
+            # 只保留新片段的内容，已结束的片段不再参与后续扫描
+            remainder = text[content_start:]
+            self._parts = [remainder]
+            self._tail = remainder[-_MARKER_LOOKBACK:]
+        if self._completed:
+            self._chunks = None
+        return self._completed[completed_before:]
+
+    def finish(self) -> list[ReActStep]:
+        """结束解析，返回最后新完成的步骤"""
+        if self._finished:
+            return []
+        self._finished = True
+
+        completed_before = len(self._completed)
+        if self._kind is not None:
+            self._close_segment("".join(self._parts).strip())
 
         # 添加最后一步
-        if current_step.thought or current_step.action or current_step.final_answer:
-            steps.append(current_step)
+        if self._current.thought or self._current.action:
+            self._completed.append(self._current)
+            self._current = ReActStep()
 
         # 如果没有解析到任何步骤，尝试将整个文本作为最终答案
-        if not steps and not current_step.final_answer:
-            current_step.final_answer = text_clean
-            steps.append(current_step)
+        if not self._completed:
+            self._completed.append(ReActStep(final_answer="".join(self._chunks or ()).strip()))
+
+        return self._completed[completed_before:]
+
+    def _close_segment(self, content: str) -> None:
+        """当前片段结束，按片段类型更新步骤状态"""
+        current_step = self._current
+        kind = self._kind
+        if kind == "thought":
+            # 新的思考，可能开始新步骤
+            if current_step.thought or current_step.action:
+                self._completed.append(current_step)
+                current_step = self._current = ReActStep()
+            current_step.thought = content
+        elif kind == "action":
+            current_step.action = content
+        elif kind == "action_input":
+            current_step.action_input = content
+        elif kind == "observation":
+            current_step.observation = content
+            # 观察后通常开始新步骤
+            if current_step.thought or current_step.action:
+                self._completed.append(current_step)
+                self._current = ReActStep()
+        elif kind == "final_answer":
+            current_step.final_answer = content
+            self._completed.append(current_step)
+            self._current = ReActStep()
 
-        return steps
+
+class ReActParser:
+    """解析 ReAct 格式的响应"""
 
     @classmethod
-    def parse_streaming(cls, accumulated_text: str) -> tuple[ReActStep | None, str]:
-        """解析流式文本，返回当前完成的步骤和剩余文本
-        
-        Returns:
-            (completed_step, remaining_text)
-        """
-        steps = cls.parse(accumulated_text)
-        
-        if not steps:
-            return None, accumulated_text
-        
-        # 找到最后一个完整的步骤
-        last_complete_step = None
-        for step in steps:
-            # 完整的步骤应该有 thought + action + observation，或者有 final_answer
-            if step.final_answer:
-                last_complete_step = step
-                # 找到 final answer 的位置
-                final_match = cls.FINAL_ANSWER_PATTERN.search(accumulated_text)
-                if final_match:
-                    end_pos = final_match.end()
-                    remaining = accumulated_text[end_pos:].strip()
-                    return step, remaining
-            elif step.thought and step.action and step.observation:
-                last_complete_step = step
-                # 找到这个步骤结束的位置
-                step_text = f"Thought: {step.thought}"
-                if step.action:
-                    step_text += f"\nAction: {step.action}"
-                if step.action_input:
-                    step_text += f"\nAction Input: {step.action_input}"
-                if step.observation:
-                    step_text += f"\nObservation: {step.observation}"
-                # 简单处理：查找最后一个 observation 的位置
-                obs_match = cls.OBSERVATION_PATTERN.finditer(accumulated_text)
-                obs_matches = list(obs_match)
-                if obs_matches:
-                    last_obs = obs_matches[-1]
-                    end_pos = last_obs.end()
-                    remaining = accumulated_text[end_pos:].strip()
-                    return step, remaining
-        
-        return None, accumulated_text
+    def parse(cls, text: str) -> list[ReActStep]:
+        """解析完整的 ReAct 格式文本，返回步骤列表"""
+        parser = StreamingReActParser()
+        parser.feed(text.strip())
+        parser.finish()
+        return parser.steps
 
     @classmethod
     def extract_final_answer(cls, text: str) -> str | None:
         """从文本中提取最终答案"""
-        match = cls.FINAL_ANSWER_PATTERN.search(text)
-        if match:
-            return match.group(1).strip()
-        
-        # 如果没有明确的 Final Answer，返回最后一步的 observation 或 thought
-        steps = cls.parse(text)
-        if steps and steps[-1].final_answer:
-            return steps[-1].final_answer
-        if steps and steps[-1].observation:
-            return steps[-1].observation
-        if steps and steps[-1].thought:
-            return steps[-1].thought
-        
-        return None
+        return _final_answer_of(cls.parse(text))
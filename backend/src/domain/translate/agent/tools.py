@@ -9,11 +9,15 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+from core.logging import get_logger
 from domain.translate.agent.react_parser import ReActParser
 from domain.translate.prompts.dev_to_pm import DEV_TO_PM_SYSTEM_PROMPT
 from domain.translate.prompts.pm_to_dev import PM_TO_DEV_SYSTEM_PROMPT
 
 
+logger = get_logger(__name__)
+
+
 class PerspectiveResult(BaseModel):
     """视角识别结果"""
 
@@ -154,6 +158,27 @@ Final Answer: [返回 JSON 格式的分析结果]
 请返回 JSON 结果（只返回 JSON，不要其他内容）："""
 
 
+TRANSLATION_SCORING_PROMPT = """你是一个严格的翻译质量评审，负责校验{target}视角的翻译结果。
+
+请对照原文评估译文：
+- 原文中的关键信息是否完整保留，没有遗漏或曲解
+- 是否已转换为{target}易于理解的表述
+- 是否符合系统提示中的输出格式要求
+
+原文：
+{original}
+
+译文：
+{candidate}
+
+请返回 JSON 格式的评分结果：
+{{
+  "score": 0.0-1.0 的评分，1.0 表示译文无需修改
+}}
+
+请返回 JSON 结果（只返回 JSON，不要其他内容）："""
+
+
 def _extract_json_from_response(response: str) -> dict[str, Any]:
     """从 LLM 响应中提取 JSON"""
     content = response.strip()
@@ -284,8 +309,43 @@ async def analyze_gaps_with_llm(
         }
 
 
+async def score_translation_with_llm(
+    original: str, candidate: str, direction: str, llm: BaseChatModel
+) -> float:
+    """使用 LLM 对译文打分，用于校验草稿模型的翻译结果
+
+    Args:
+        original: 原始内容
+        candidate: 待校验的译文
+        direction: 翻译方向（pm_to_dev 或 dev_to_pm）
+        llm: 负责评审的 LLM 实例
+
+    Returns:
+        0-1 的评分，评审失败时返回 0.0（按未通过处理）
+    """
+    target = "开发工程师" if direction == "pm_to_dev" else "产品经理"
+    messages = [
+        SystemMessage(content="你是一个严格的翻译质量评审。请严格按要求返回 JSON 格式。"),
+        HumanMessage(content=TRANSLATION_SCORING_PROMPT.format(target=target, original=original, candidate=candidate)),
+    ]
+
+    try:
+        response = await llm.ainvoke(messages)
+        response_text = str(response.content) if hasattr(response, "content") else str(response)
+        result = _extract_json_from_response(response_text)
+        return max(0.0, min(1.0, float(result.get("score", 0.0))))
+    except Exception:
+        logger.exception("草稿译文评分失败")
+        return 0.0
+
+
+# 各翻译方向的系统提示词在导入时确定，请求路径上只做字典查找
+_SYSTEM_PROMPTS: dict[str, str] = {
+    "pm_to_dev": PM_TO_DEV_SYSTEM_PROMPT,
+    "dev_to_pm": DEV_TO_PM_SYSTEM_PROMPT,
+}
+
+
 def get_system_prompt(direction: str) -> str:
-    """获取翻译方向对应的系统提示词"""
-    if direction == "pm_to_dev":
-        return PM_TO_DEV_SYSTEM_PROMPT
-    return DEV_TO_PM_SYSTEM_PROMPT
+    """获取翻译方向对应的系统提示词（未知方向按 dev_to_pm 处理）"""
+    return _SYSTEM_PROMPTS.get(direction, DEV_TO_PM_SYSTEM_PROMPT)
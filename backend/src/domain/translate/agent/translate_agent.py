@@ -2,59 +2,96 @@
 
 from __future__ import annotations
 
-import uuid
+import asyncio
+import io
+import secrets
+import unicodedata
 from collections.abc import AsyncIterator
+from contextvars import ContextVar
 from dataclasses import dataclass, field
+from functools import singledispatch
 from typing import Any, TypedDict, cast
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import AIMessageChunk, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from core.logging import get_logger
-from domain.translate.agent.react_parser import ReActParser
+from domain.translate.agent.cache import CachedTranslation, LLMResponseCache, canonicalize
+from domain.translate.agent.react_parser import ReActParser, StreamingReActParser
 from domain.translate.agent.tools import (
     analyze_gaps_with_llm,
     get_system_prompt,
+    score_translation_with_llm,
 )
 from domain.translate.graph.checkpoint import TenantAwarePostgresSaver
-from domain.translate.prompts.dev_to_pm import DEV_TO_PM_SYSTEM_PROMPT
 
 
 logger = get_logger(__name__)
 
+# 缓存命中时回放 content_delta 的分块大小（字符数）
+_REPLAY_CHUNK_SIZE = 40
+
+# 流式增量合并：累计达到该字符数，或距上次发送超过该时长（秒）时发送一次 content_delta
+_DELTA_FLUSH_CHARS = 32
+_DELTA_FLUSH_INTERVAL = 0.02
+
+# 内容短于该字符数且无缺失信息时，流式翻译先使用草稿模型
+_DRAFT_MAX_CHARS = 500
+
+# 翻译提示词的固定前缀（指令与输出格式），每次请求逐字节一致
+_TRANSLATE_PREAMBLE = (
+    "请按照 ReAct 格式进行翻译。\n\n"
+    "请按照以下格式输出：\n"
+    "Thought: [分析待翻译内容，理解关键信息]\n"
+    "Action: translate_to_target\n"
+    "Action Input: [待翻译的内容和上下文]\n"
+    "Observation: [初步翻译结果]\n"
+    "Final Answer: [最终的翻译结果，按照系统提示中的输出格式要求]"
+)
+
+# 与缺失分析并行预取的翻译任务（按“无缺失信息”假设构建提示词），由 translate 节点消费
+_speculative_translation: ContextVar[asyncio.Task[str] | None] = ContextVar("speculative_translation", default=None)
+
+
+def _normalize_block(text: str) -> str:
+    """规范化多行文本：NFC 归一化并去除行尾空白，保留换行结构"""
+    lines = unicodedata.normalize("NFC", text).splitlines()
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+@singledispatch
+def _part_to_str(part: object) -> str:
+    """多部分内容中的单个片段转文本，未知类型忽略"""
+    return ""
+
+
+@_part_to_str.register(str)
+def _(part: str) -> str:
+    return part
+
+
+@_part_to_str.register(dict)
+def _(part: dict[str, Any]) -> str:
+    return str(part.get("text", ""))
+
+
+def _join_parts(raw_content: list[str | dict[str, Any]]) -> str:
+    """拼接 LangChain 返回的 list[str | dict] 格式多部分内容"""
+    if len(raw_content) == 1 and isinstance(raw_content[0], str):
+        return raw_content[0]
+    return "".join(_part_to_str(part) for part in raw_content)
+
 
-def _extract_text_content(message: BaseMessage) -> str:
-    """从 LLM 消息中提取纯文本内容"""
+def _extract_content(message: BaseMessage) -> str:
+    """从 LLM 消息或流式消息块（AIMessageChunk）中提取纯文本内容"""
     raw_content = message.content
     if isinstance(raw_content, str):
         return raw_content
-    # LangChain 返回 list[str | dict] 格式的多部分内容
-    text_parts: list[str] = []
-    for part in cast(list[object], raw_content):
-        if isinstance(part, str):
-            text_parts.append(part)
-        elif isinstance(part, dict) and "text" in part:
-            text_parts.append(str(part["text"]))
-    return "".join(text_parts)
-
-
-def _extract_chunk_content(chunk: AIMessageChunk) -> str:
-    """从流式消息块中提取文本内容"""
-    raw_content = chunk.content
-    if isinstance(raw_content, str):
-        return raw_content
-    if not raw_content:
-        return ""
-    # LangChain 返回 list[str | dict] 格式的多部分内容
-    text_parts: list[str] = []
-    for part in cast(list[object], raw_content):
-        if isinstance(part, str):
-            text_parts.append(part)
-        elif isinstance(part, dict) and "text" in part:
-            text_parts.append(str(part["text"]))
-    return "".join(text_parts)
+    # 空列表时 _join_parts 返回空字符串
+    return _join_parts(raw_content)
 
 
 def _empty_gaps() -> list[dict[str, Any]]:
@@ -65,6 +102,91 @@ def _empty_suggestions() -> list[str]:
     return []
 
 
+async def _coalesce_deltas(deltas: AsyncIterator[str]) -> AsyncIterator[str]:
+    """合并短时间内到达的多个增量，减少下游 SSE 事件与 JSON 编码次数
+
+    累积的增量最多保留 _DELTA_FLUSH_INTERVAL 秒：上游停顿时按时发出，不必等到下一个增量到达。
+    """
+    loop = asyncio.get_running_loop()
+    pending: list[str] = []
+    pending_chars = 0
+    last_flush = loop.time()
+    # 整个流只创建一个预取任务：带超时等待时超时只取消队列读取，不会中断上游
+    stream = _PrefetchedStream(deltas)
+    try:
+        while True:
+            if pending:
+                window = asyncio.timeout_at(last_flush + _DELTA_FLUSH_INTERVAL)
+                try:
+                    async with window:
+                        delta = await stream.next()
+                except TimeoutError:
+                    # 上游自身抛出的 TimeoutError 原样传播
+                    if not window.expired():
+                        raise
+                    yield "".join(pending)
+                    pending.clear()
+                    pending_chars = 0
+                    last_flush = loop.time()
+                    continue
+            else:
+                delta = await stream.next()
+            if delta is None:
+                break
+            pending.append(delta)
+            pending_chars += len(delta)
+            if pending_chars >= _DELTA_FLUSH_CHARS or loop.time() - last_flush >= _DELTA_FLUSH_INTERVAL:
+                yield "".join(pending)
+                pending.clear()
+                pending_chars = 0
+                last_flush = loop.time()
+    finally:
+        stream.cancel()
+    if pending:
+        yield "".join(pending)
+
+
+def _discard(task: asyncio.Task[Any]) -> None:
+    """放弃后台任务：未完成则取消，已完成则取走异常，避免未处理异常告警"""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+class _PrefetchedStream:
+    """在后台预取 LLM 流式输出，缺失分析结束后按需回放或丢弃"""
+
+    def __init__(self, deltas: AsyncIterator[str]) -> None:
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._exhausted = False
+        self._task = asyncio.create_task(self._pump(deltas))
+
+    async def _pump(self, deltas: AsyncIterator[str]) -> None:
+        try:
+            async for delta in deltas:
+                self._queue.put_nowait(delta)
+        finally:
+            self._queue.put_nowait(None)
+
+    async def next(self) -> str | None:
+        """取下一个增量，流结束后返回 None，预取失败时抛出原始异常"""
+        if not self._exhausted and (delta := await self._queue.get()) is not None:
+            return delta
+        self._exhausted = True
+        await self._task
+        return None
+
+    async def drain(self) -> AsyncIterator[str]:
+        """依次产出已预取和后续到达的增量，预取失败时抛出原始异常"""
+        while (delta := await self.next()) is not None:
+            yield delta
+
+    def cancel(self) -> None:
+        """放弃预取结果"""
+        _discard(self._task)
+
+
 class TranslateState(TypedDict, total=False):
     content: str
     context: str | None
@@ -75,6 +197,30 @@ class TranslateState(TypedDict, total=False):
     system_prompt: str
     translated_content: str
     error_message: str | None
+    want_translation: bool
+
+
+# 节点提前返回时的固定更新，所有调用共享同一对象，不得修改（LangGraph 只读取更新内容合并到自身状态）
+_EMPTY_UPDATE: TranslateState = {}
+_EMPTY_TRANSLATION: TranslateState = {"translated_content": ""}
+
+
+def _error_result(direction: str, msg: str) -> TranslateState:
+    """缺失分析失败时的状态更新"""
+    return {
+        "direction": direction,
+        "system_prompt": get_system_prompt(direction),
+        "gaps": [],
+        "suggestions": [],
+        "error_message": msg,
+    }
+
+
+def _route_after_gaps(state: TranslateState) -> str:
+    """缺失分析后的路由：需要翻译且未出错时进入翻译节点，否则结束"""
+    if state.get("want_translation") and not state.get("error_message"):
+        return "translate"
+    return END
 
 
 @dataclass
@@ -91,30 +237,40 @@ class TranslateResult:
 class TranslateAgent:
     """智能翻译 Agent"""
 
-    def __init__(self, llm: BaseChatModel) -> None:
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        response_cache: LLMResponseCache | None = None,
+        *,
+        draft_llm: BaseChatModel | None = None,
+        model_name: str = "qwen-max",
+        draft_model_name: str = "",
+        draft_score_threshold: float = 0.8,
+        enable_checkpointing: bool = False,
+    ) -> None:
         self.llm = llm
-        self.checkpointer = TenantAwarePostgresSaver()
-        self.graph = self._build_graph(include_translation=True)
-        self.preprocess_graph = self._build_graph(include_translation=False)
-
-    def _build_graph(
-        self, *, include_translation: bool
-    ) -> CompiledStateGraph[TranslateState, None, TranslateState, TranslateState]:
+        self.draft_llm = draft_llm
+        self.model_name = model_name
+        self.draft_model_name = draft_model_name
+        self.draft_score_threshold = draft_score_threshold
+        self.response_cache = response_cache
+        # 单次翻译不会恢复或回溯，默认不持久化每个节点的执行状态
+        self.checkpointer = TenantAwarePostgresSaver() if enable_checkpointing else None
+        self.graph = self._build_graph()
+
+    def _build_graph(self) -> CompiledStateGraph[TranslateState, None, TranslateState, TranslateState]:
         graph: StateGraph[TranslateState] = StateGraph(TranslateState)
         graph.add_node("analyze_gaps", self._node_analyze_gaps)
-        if include_translation:
-            graph.add_node("translate", self._node_translate)
+        graph.add_node("translate", self._node_translate)
         graph.set_entry_point("analyze_gaps")
-        if include_translation:
-            graph.add_edge("analyze_gaps", "translate")
-            graph.add_edge("translate", END)
-        else:
-            graph.add_edge("analyze_gaps", END)
+        # 同步模式继续翻译；流式模式只做预处理，翻译阶段在图外直接流式调用 LLM
+        graph.add_conditional_edges("analyze_gaps", _route_after_gaps, {"translate": "translate", END: END})
+        graph.add_edge("translate", END)
         return graph.compile(checkpointer=self.checkpointer)
 
     async def _node_analyze_gaps(self, state: TranslateState) -> TranslateState:
         if state.get("error_message"):
-            return {}
+            return _EMPTY_UPDATE
 
         try:
             content = state.get("content", "")
@@ -123,13 +279,7 @@ class TranslateAgent:
             if not forced_direction:
                 error_msg = "翻译方向未指定，请在前端选择翻译方向"
                 logger.error(error_msg)
-                return {
-                    "direction": "dev_to_pm",
-                    "system_prompt": get_system_prompt("dev_to_pm"),
-                    "gaps": [],
-                    "suggestions": [],
-                    "error_message": error_msg,
-                }
+                return _error_result("dev_to_pm", error_msg)
             direction = forced_direction
             logger.info("使用前端指定的翻译方向: %s", direction)
             
@@ -149,38 +299,25 @@ class TranslateAgent:
             logger.exception("缺失分析节点失败")
             forced_direction = state.get("forced_direction")
             direction = forced_direction if forced_direction else "dev_to_pm"
-            system_prompt = get_system_prompt(direction)
-            return {
-                "gaps": [],
-                "suggestions": [],
-                "direction": direction,
-                "system_prompt": system_prompt,
-                "error_message": f"缺失分析失败: {e!s}",
-            }
+            return _error_result(direction, f"缺失分析失败: {e!s}")
 
     async def _node_translate(self, state: TranslateState) -> TranslateState:
         if state.get("error_message"):
-            return {"translated_content": ""}
+            return _EMPTY_TRANSLATION
 
         try:
             system_prompt = state.get("system_prompt", "")
             content = state.get("content", "")
             gaps = state.get("gaps", [])
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=self._build_translate_prompt(content, state.get("context"), gaps)),
-            ]
-            response = await self.llm.ainvoke(messages)
-            response_text = _extract_text_content(response)
-            
-            # 解析 ReAct 格式，提取最终答案
-            final_answer = ReActParser.extract_final_answer(response_text)
-            if final_answer:
-                translated_content = final_answer
+            speculation = _speculative_translation.get()
+            if speculation is not None and not gaps:
+                # 没有缺失信息时提示词与预取时一致，直接复用并行发起的翻译结果
+                translated_content = await speculation
             else:
-                # 如果没有找到 Final Answer，使用原始响应
-                translated_content = response_text
-            
+                if speculation is not None:
+                    _discard(speculation)
+                translated_content = await self._run_translation(system_prompt, content, state.get("context"), gaps)
+
             return {"translated_content": translated_content}
         except Exception as e:
             logger.exception("翻译节点失败")
@@ -194,26 +331,53 @@ class TranslateAgent:
         content: str,
         context: str | None = None,
         direction: str | None = None,
-        model: str | None = None,
     ) -> TranslateResult:
         """执行翻译（同步模式）"""
-        if model and model not in ("auto", "qwen-max"):
-            logger.warning("暂不支持模型 %s，使用默认模型", model)
-
         if not direction:
             raise ValueError("翻译方向必须指定，请在前端选择翻译方向")
 
-        thread_id = uuid.uuid4().hex
-        state = await self.graph.ainvoke(
-            {"content": content, "context": context, "forced_direction": direction},
-            config={"configurable": {"thread_id": thread_id}},
+        if self.response_cache is not None and (cached := self.response_cache.get(content, direction, context)):
+            return TranslateResult(
+                original_content=content,
+                translated_content=cached.translated_content,
+                direction=cached.direction,
+                gaps=cached.gaps,
+                suggestions=cached.suggestions,
+            )
+
+        # 缺失分析与翻译相互独立：按“无缺失信息”假设提前发起翻译，隐藏一次 LLM 往返
+        speculation = asyncio.create_task(
+            self._run_translation(get_system_prompt(direction), content, context, [])
         )
+        token = _speculative_translation.set(speculation)
+        try:
+            state = await self.graph.ainvoke(
+                {"content": content, "context": context, "forced_direction": direction, "want_translation": True},
+                config=self._graph_config(),
+            )
+        finally:
+            _speculative_translation.reset(token)
+            _discard(speculation)
         gaps = state.get("gaps", [])
         suggestions = state.get("suggestions", [])
         final_direction = state.get("direction", direction)
         translated_content = state.get("translated_content", "")
         logger.info("翻译完成，方向: %s", final_direction)
 
+        if self.response_cache is not None and translated_content and not state.get("error_message"):
+            self.response_cache.put(
+                content,
+                direction,
+                context,
+                CachedTranslation(
+                    translated_content=translated_content,
+                    direction=final_direction,
+                    gaps=gaps,
+                    suggestions=suggestions,
+                    model=self.model_name,
+                ),
+            )
+
         return TranslateResult(
             original_content=content,
             translated_content=translated_content,
@@ -227,12 +391,8 @@ class TranslateAgent:
         content: str,
         context: str | None = None,
         direction: str | None = None,
-        model: str | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
         """执行翻译（流式模式）"""
-        if model and model not in ("auto", "qwen-max"):
-            logger.warning("暂不支持模型 %s，使用默认模型", model)
-
         if not direction:
             yield {
                 "event": "error",
@@ -240,14 +400,45 @@ class TranslateAgent:
             }
             return
 
-        thread_id = uuid.uuid4().hex
+        if self.response_cache is not None and (cached := self.response_cache.get(content, direction, context)):
+            async for event in self._replay_cached(cached):
+                yield event
+            return
 
+        # 缺失分析与翻译相互独立：按“无缺失信息”假设在后台预取翻译输出，隐藏一次 LLM 首包延迟
+        system_prompt = get_system_prompt(direction)
+        speculation_llm = self.draft_llm if self._should_use_draft(content, []) else self.llm
+        speculation = _PrefetchedStream(
+            self._stream_deltas(self._build_messages(system_prompt, content, context, []), speculation_llm)
+        )
+        try:
+            async for event in self._translate_stream_stages(content, context, direction, system_prompt, speculation):
+                yield event
+        finally:
+            speculation.cancel()
+
+    async def _translate_stream_stages(
+        self,
+        content: str,
+        context: str | None,
+        direction: str,
+        system_prompt: str,
+        speculation: _PrefetchedStream,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """流式翻译的预处理与翻译阶段"""
         # 阶段 1: 预处理（缺失分析）
+        preprocess_input: TranslateState = {
+            "content": content,
+            "context": context,
+            "forced_direction": direction,
+            "want_translation": False,
+        }
         try:
-            state = await self.preprocess_graph.ainvoke(
-                {"content": content, "context": context, "forced_direction": direction},
-                config={"configurable": {"thread_id": thread_id}},
-            )
+            if self.checkpointer is None:
+                # 无需持久化时图没有额外价值，直接执行缺失分析
+                state = await self._node_analyze_gaps(preprocess_input)
+            else:
+                state = cast(TranslateState, await self.graph.ainvoke(preprocess_input, config=self._graph_config()))
         except Exception as e:
             logger.exception("预处理阶段失败")
             yield {
@@ -278,48 +469,73 @@ class TranslateAgent:
 
         # 使用前端指定的 direction
         final_direction = direction
-        system_prompt = get_system_prompt(final_direction)
+        use_draft = self._should_use_draft(content, gaps)
 
         yield {
             "event": "translation_start",
-            "data": {"direction": final_direction},
+            "data": {"direction": final_direction, "model": self.draft_model_name if use_draft else self.model_name},
         }
 
-        # 阶段 2: 流式翻译
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=self._build_translate_prompt(content, context, gaps)),
-        ]
+        # 阶段 2: 流式翻译（无缺失信息时直接回放预取的输出，否则按补充后的提示词重新发起）
+        if gaps:
+            speculation.cancel()
+            deltas = self._stream_deltas(self._build_messages(system_prompt, content, context, gaps))
+        else:
+            deltas = speculation.drain()
 
         try:
-            content_parts: list[str] = []
-            accumulated_text = ""
-            async for chunk in self.llm.astream(messages):
-                delta = _extract_chunk_content(chunk)
-                if delta:
-                    content_parts.append(delta)
-                    accumulated_text += delta
-                    
-                    # 尝试解析 ReAct 格式的流式输出
-                    completed_step, _ = ReActParser.parse_streaming(accumulated_text)
-                    if completed_step:
-                        # 如果解析到完整的步骤，可以发送步骤信息（可选）
-                        if completed_step.final_answer:
-                            # 如果已获得最终答案，发送最终答案的增量部分
-                            pass
-                    
-                    yield {
-                        "event": "content_delta",
-                        "data": {"delta": delta},
-                    }
-            full_content = "".join(content_parts)
-            
-            # 从完整内容中提取最终答案
-            final_answer = ReActParser.extract_final_answer(full_content)
-            if final_answer:
-                full_content = final_answer
+            while True:
+                content_buffer = io.StringIO()
+                react_parser = StreamingReActParser()
+                draft_failed = False
+                try:
+                    async for delta in _coalesce_deltas(deltas):
+                        content_buffer.write(delta)
+                        # 增量解析 ReAct 格式，只扫描新到达的文本
+                        react_parser.feed(delta)
+                        yield {
+                            "event": "content_delta",
+                            "data": {"delta": delta},
+                        }
+                except Exception:
+                    # 草稿模型出错与校验未通过一样回退主模型；主模型出错则直接上报
+                    if not use_draft:
+                        raise
+                    logger.exception("[流式] 草稿模型翻译失败，改用 %s 重新翻译", self.model_name)
+                    draft_failed = True
+                react_parser.finish()
+                raw_text = content_buffer.getvalue()
+
+                # 从完整内容中提取最终答案
+                full_content = react_parser.final_answer or raw_text
+                if not use_draft or (
+                    not draft_failed and await self._verify_draft(content, full_content, final_direction)
+                ):
+                    break
+
+                # 草稿译文不可用：再次发送 translation_start 通知前端清空内容，改用主模型重新翻译
+                use_draft = False
+                yield {
+                    "event": "translation_start",
+                    "data": {"direction": final_direction, "model": self.model_name},
+                }
+                deltas = self._stream_deltas(self._build_messages(system_prompt, content, context, gaps))
 
             logger.info("[流式] 翻译完成，方向: %s", final_direction)
+            if self.response_cache is not None and full_content:
+                self.response_cache.put(
+                    content,
+                    direction,
+                    context,
+                    CachedTranslation(
+                        translated_content=full_content,
+                        direction=final_direction,
+                        gaps=gaps,
+                        suggestions=suggestions,
+                        raw_text=raw_text,
+                        model=self.draft_model_name if use_draft else self.model_name,
+                    ),
+                )
             yield {
                 "event": "message_done",
                 "data": {
@@ -336,32 +552,112 @@ class TranslateAgent:
                 "data": {"message": f"翻译失败: {e!s}", "stage": "translate"},
             }
 
-    def _build_translate_prompt(
+    def _graph_config(self) -> RunnableConfig | None:
+        """构建图调用配置，仅在启用 checkpoint 时需要 thread_id
+
+        thread_id 只在单次调用内使用，16 位十六进制随机串即可避免冲突。
+        """
+        if self.checkpointer is None:
+            return None
+        return {"configurable": {"thread_id": secrets.token_hex(8)}}
+
+    def _build_messages(
         self,
+        system_prompt: str,
+        content: str,
+        context: str | None,
+        gaps: list[dict[str, Any]],
+    ) -> list[BaseMessage]:
+        """构建翻译请求消息"""
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=self._build_translate_prompt(content, context, gaps)),
+        ]
+
+    async def _run_translation(
+        self,
+        system_prompt: str,
         content: str,
         context: str | None,
         gaps: list[dict[str, Any]],
     ) -> str:
-        """构建翻译提示"""
-        prompt_parts = ["请按照 ReAct 格式进行翻译。\n"]
-        prompt_parts.append(f"\n待翻译内容：\n{content}")
+        """调用 LLM 执行翻译，返回解析后的最终答案"""
+        response = await self.llm.ainvoke(self._build_messages(system_prompt, content, context, gaps))
+        response_text = _extract_content(response)
+
+        # 解析 ReAct 格式，提取最终答案；如果没有找到 Final Answer，使用原始响应
+        return ReActParser.extract_final_answer(response_text) or response_text
+
+    def _should_use_draft(self, content: str, gaps: list[dict[str, Any]]) -> bool:
+        """短文本且无缺失信息时，译文接近模板化，可先由草稿模型生成"""
+        return self.draft_llm is not None and len(content) < _DRAFT_MAX_CHARS and not gaps
+
+    async def _verify_draft(self, content: str, candidate: str, direction: str) -> bool:
+        """由主模型对草稿译文打分，达到阈值才采用"""
+        score = await score_translation_with_llm(content, candidate, direction, self.llm)
+        passed = score >= self.draft_score_threshold
+        logger.info("[流式] 草稿译文校验得分 %.2f，%s", score, "采用" if passed else f"改用 {self.model_name} 重新翻译")
+        return passed
+
+    async def _stream_deltas(
+        self, messages: list[BaseMessage], llm: BaseChatModel | None = None
+    ) -> AsyncIterator[str]:
+        """流式调用 LLM（默认主模型），产出非空的文本增量"""
+        async for chunk in (llm or self.llm).astream(messages):
+            if delta := _extract_content(chunk):
+                yield delta
+
+    async def _replay_cached(self, cached: CachedTranslation) -> AsyncIterator[dict[str, Any]]:
+        """回放缓存的翻译结果，事件序列与实时流式翻译保持一致"""
+        if cached.gaps:
+            yield {
+                "event": "gaps_identified",
+                "data": {
+                    "gaps": cached.gaps,
+                    "suggestions": cached.suggestions,
+                },
+            }
 
-        if context:
-            prompt_parts.append(f"\n\n补充上下文：\n{context}")
+        yield {
+            "event": "translation_start",
+            "data": {"direction": cached.direction, "model": cached.model or self.model_name, "cached": True},
+        }
 
-        if gaps:
-            gap_descriptions = [f"- {g['description']}" for g in gaps]
-            prompt_parts.append(
-                "\n\n注意：输入中可能缺失以下信息，请在翻译时适当补充或标注：\n" + "\n".join(gap_descriptions)
-            )
-        
-        prompt_parts.append(
-            "\n\n请按照以下格式输出：\n"
-            "Thought: [分析待翻译内容，理解关键信息]\n"
-            "Action: translate_to_target\n"
-            "Action Input: [待翻译的内容和上下文]\n"
-            "Observation: [初步翻译结果]\n"
-            "Final Answer: [最终的翻译结果，按照系统提示中的输出格式要求]"
-        )
+        replay_text = cached.raw_text or cached.translated_content
+        for start in range(0, len(replay_text), _REPLAY_CHUNK_SIZE):
+            yield {
+                "event": "content_delta",
+                "data": {"delta": replay_text[start : start + _REPLAY_CHUNK_SIZE]},
+            }
+
+        logger.info("[流式] 命中翻译缓存，方向: %s", cached.direction)
+        yield {
+            "event": "message_done",
+            "data": {
+                "translated_content": cached.translated_content,
+                "direction": cached.direction,
+                "gaps": cached.gaps,
+                "suggestions": cached.suggestions,
+            },
+        }
 
-        return "".join(prompt_parts)
+    def _build_translate_prompt(
+        self,
+        content: str,
+        context: str | None,
+        gaps: list[dict[str, Any]],
+    ) -> str:
+        """构建翻译提示
+
+        按“稳定前缀 → 可变后缀”排列：固定指令 → 上下文 → 缺失信息 → 待翻译内容，
+        使不同请求共享尽可能长的相同前缀，提高服务端前缀缓存命中率。
+        """
+        normalized_context = _normalize_block(context) if context else ""
+        # 缺失信息按描述排序，保证相同的缺失信息集合生成相同的文本；整块只做一次 join
+        gap_block = "\n- ".join(sorted(canonicalize(str(g["description"])) for g in gaps))
+        return "".join((
+            _TRANSLATE_PREAMBLE,
+            f"\n\n补充上下文：\n{normalized_context}" if normalized_context else "",
+            f"\n\n注意：输入中可能缺失以下信息，请在翻译时适当补充或标注：\n- {gap_block}" if gaps else "",
+            f"\n\n待翻译内容：\n{_normalize_block(content)}",
+        ))
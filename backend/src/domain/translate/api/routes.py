@@ -35,7 +35,7 @@ async def translate(
         return error_response("流式模式请使用 /api/translate/stream 端点", code=400)
 
     try:
-        result = await service.translate(session, request.content, request.context, request.direction, request.model)
+        result = await service.translate(session, request.content, request.context, request.direction)
         return success_response(result)
     except Exception as e:
         logger.exception("翻译失败")
@@ -54,7 +54,7 @@ async def translate_stream(
     async def generate():
         try:
             async for event in service.translate_stream(
-                session, request.content, request.context, request.direction, request.model
+                session, request.content, request.context, request.direction
             ):
                 yield sse_event(event["event"], event["data"])
         except Exception as e:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import uuid
 from collections.abc import AsyncIterator, Callable, Coroutine, Iterator, Sequence
+from contextlib import asynccontextmanager
 from typing import Any, Protocol, cast, override, runtime_checkable
 
 from langchain_core.runnables import RunnableConfig
@@ -14,11 +15,15 @@ from langgraph.checkpoint.base import (
     CheckpointTuple,
 )
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg import AsyncConnection, AsyncCursor
+from psycopg.rows import DictRow, dict_row
+from psycopg_pool import AsyncConnectionPool
 
 from config import config_manager
 from core.context.request import current_realm
 from core.logging import get_logger
 from core.type.common import JSONDict
+from domain.translate.graph.serde import CompressedJsonPlusSerializer, configure_checkpoint_connection
 
 
 logger = get_logger(__name__)
@@ -92,38 +97,105 @@ def _run_sync(coro: Coroutine[object, object, object]) -> object:
     raise RuntimeError(msg)
 
 
+class CheckpointPool:
+    """LangGraph checkpoint 共享连接池（所有租户共用）
+
+    应在应用启动时调用 open()，关闭时调用 close()；
+    未预先打开时，首次获取会自动打开。
+    """
+
+    def __init__(self) -> None:
+        self._pool: AsyncConnectionPool[AsyncConnection[DictRow]] | None = None
+
+    async def open(self) -> AsyncConnectionPool[AsyncConnection[DictRow]]:
+        """打开连接池（可重复调用）"""
+        if self._pool is None:
+            db_config = config_manager.database
+            # AsyncPostgresSaver 要求连接开启 autocommit 并使用 dict_row
+            self._pool = AsyncConnectionPool(
+                db_config.build_postgres_url(),
+                min_size=db_config.checkpoint_pool_min_size,
+                max_size=db_config.checkpoint_pool_max_size,
+                kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+                configure=configure_checkpoint_connection,
+                open=False,
+            )
+        await self._pool.open()
+        return self._pool
+
+    async def close(self) -> None:
+        """关闭连接池"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            logger.info("Checkpoint 连接池已关闭")
+
+
+checkpoint_pool = CheckpointPool()
+
+
+class _PooledPostgresSaver(AsyncPostgresSaver):
+    """基于共享连接池的 AsyncPostgresSaver
+
+    上游 _cursor 对每次操作都持有实例级锁，以保护单个共享连接；
+    连接池模式下每次操作各自借用连接，去掉该锁后同一租户的操作可以并发执行。
+    """
+
+    @override
+    @asynccontextmanager
+    async def _cursor(self, *, pipeline: bool = False) -> AsyncIterator[AsyncCursor[DictRow]]:
+        pool = cast(AsyncConnectionPool[AsyncConnection[DictRow]], self.conn)
+        async with pool.connection() as conn:
+            if not pipeline:
+                async with conn.cursor(binary=True, row_factory=dict_row) as cur:
+                    yield cur
+            elif self.supports_pipeline:
+                async with conn.pipeline(), conn.cursor(binary=True, row_factory=dict_row) as cur:
+                    yield cur
+            else:
+                async with conn.transaction(), conn.cursor(binary=True, row_factory=dict_row) as cur:
+                    yield cur
+
+
 class TenantAwarePostgresSaver(BaseCheckpointSaver[str]):
     """多租户感知的 PostgreSQL 检查点保存器。"""
 
     def __init__(self) -> None:
         super().__init__()
         self.savers: dict[str, CheckpointSaverProtocol] = {}
-        self._context_managers: dict[str, Any] = {}
-        self._locks: dict[str, asyncio.Lock] = {}
-        self._init_lock = asyncio.Lock()
-        self._setup_done: dict[str, bool] = {}
+        self._setup_events: dict[str, asyncio.Event] = {}
 
     async def aget_checkpointer(self) -> CheckpointSaverProtocol:
-        """异步获取当前租户的检查点处理器。"""
+        """异步获取当前租户的检查点处理器。
+
+        首个访问某租户的调用负责创建保存器，并发的其他调用只等待其完成；
+        初始化完成后直接读取，不再经过任何锁。
+        """
         realm = current_realm()
-        if realm not in self._locks:
-            async with self._init_lock:
-                if realm not in self._locks:
-                    self._locks[realm] = asyncio.Lock()
-        async with self._locks[realm]:
-            if realm not in self.savers:
-                logger.info("为租户 %s 创建新的 AsyncPostgresSaver 实例", realm)
-                db_config = config_manager.database
-                postgres_url = db_config.build_postgres_url()
-                saver_cm = AsyncPostgresSaver.from_conn_string(postgres_url, pipeline=False)
-                saver = await saver_cm.__aenter__()  # type: ignore[attr-defined]
-                self._context_managers[realm] = saver_cm
-                if realm not in self._setup_done or not self._setup_done[realm]:
-                    await saver.setup()
-                    self._setup_done[realm] = True
-                    logger.info("PostgreSQL checkpoint 表已初始化")
-                self.savers[realm] = cast(CheckpointSaverProtocol, saver)
-        return self.savers[realm]
+        while (saver := self.savers.get(realm)) is None:
+            # 事件循环单线程执行，get 与赋值之间没有 await，检查与登记是原子的
+            if (event := self._setup_events.get(realm)) is not None:
+                await event.wait()
+                continue
+            event = self._setup_events[realm] = asyncio.Event()
+            try:
+                self.savers[realm] = await self._create_saver(realm)
+            finally:
+                # 创建失败时移除事件，等待者被唤醒后由其中一个重新尝试
+                if realm not in self.savers:
+                    del self._setup_events[realm]
+                event.set()
+        return saver
+
+    async def _create_saver(self, realm: str) -> CheckpointSaverProtocol:
+        """为租户创建保存器并初始化 checkpoint 表。"""
+        logger.info("为租户 %s 创建新的 AsyncPostgresSaver 实例", realm)
+        # 所有租户共享连接池；aput / aput_writes 内部会在 pipeline 中批量执行语句
+        pool = await checkpoint_pool.open()
+        saver = _PooledPostgresSaver(conn=pool, serde=CompressedJsonPlusSerializer())
+        await saver.setup()
+        logger.info("PostgreSQL checkpoint 表已初始化")
+        return cast(CheckpointSaverProtocol, saver)
 
     def _get_checkpointer_sync(self) -> CheckpointSaverProtocol:
         """同步场景下获取当前租户的保存器。"""
@@ -2,18 +2,40 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Models the agent can currently serve; anything else falls back to the default model
+_SUPPORTED_MODELS = frozenset({"auto", "qwen-max"})
 
 
 class TranslateRequest(BaseModel):
     """Translation request
 
     direction must be specified by the frontend (pm_to_dev or dev_to_pm)
-    If model is specified, the specified model will be used; otherwise the default configured model will be used
+    model is accepted for compatibility only; the configured model is always used
     """
 
+    model_config = ConfigDict(str_strip_whitespace=True, str_max_length=10000, frozen=True)
+
     content: str = Field(..., min_length=1, max_length=10000, description="Content to translate")
     stream: bool = Field(default=True, description="Whether to stream output")
     context: str | None = Field(default=None, max_length=2000, description="Additional context")
-    direction: str | None = Field(default=None, description="Translation direction: pm_to_dev or dev_to_pm (required, must be specified by frontend)")
+    direction: Literal["pm_to_dev", "dev_to_pm"] | None = Field(
+        default=None, description="Translation direction: pm_to_dev or dev_to_pm (required, must be specified by frontend)"
+    )
     model: str | None = Field(default=None, description="Model name: auto, qwen-max or openai, leave empty to use default configuration")
+
+    @field_validator("model")
+    @classmethod
+    def _warn_unsupported_model(cls, value: str | None) -> str | None:
+        """Log unsupported models once at parse time (the default model is used instead)"""
+        if value and value not in _SUPPORTED_MODELS:
+            logger.warning("暂不支持模型 %s，使用默认模型", value)
+        return value
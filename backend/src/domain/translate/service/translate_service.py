@@ -9,6 +9,7 @@ from uuid import UUID
 from langchain_core.language_models import BaseChatModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domain.translate.agent.cache import LLMResponseCache
 from domain.translate.agent.translate_agent import TranslateAgent, TranslateResult
 from domain.translate.repository.translate_repository import TranslateRepository
 from domain.translate.schema.response import TranslateResponse, TranslationRecord
@@ -21,8 +22,22 @@ class TranslateService:
         self,
         llm: BaseChatModel,
         repository: TranslateRepository,
+        response_cache: LLMResponseCache | None = None,
+        draft_llm: BaseChatModel | None = None,
+        model_name: str = "qwen-max",
+        draft_model_name: str = "",
+        draft_score_threshold: float = 0.8,
+        enable_checkpointing: bool = False,
     ) -> None:
-        self.agent = TranslateAgent(llm)
+        self.agent = TranslateAgent(
+            llm,
+            response_cache=response_cache,
+            draft_llm=draft_llm,
+            model_name=model_name,
+            draft_model_name=draft_model_name,
+            draft_score_threshold=draft_score_threshold,
+            enable_checkpointing=enable_checkpointing,
+        )
         self.repository = repository
 
     async def translate(
@@ -31,11 +46,10 @@ class TranslateService:
         content: str,
         context: str | None = None,
         direction: str | None = None,
-        model: str | None = None,
     ) -> TranslateResponse:
         """执行翻译（同步模式）"""
         # 调用 Agent 翻译
-        result = await self.agent.translate(content, context, direction, model)
+        result = await self.agent.translate(content, context, direction)
 
         # 保存记录
         await self.repository.create(session, result)
@@ -58,14 +72,13 @@ class TranslateService:
         content: str,
         context: str | None = None,
         direction: str | None = None,
-        model: str | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
         """执行翻译（流式模式）"""
         final_result: TranslateResult | None = None
         final_event_data: dict[str, Any] | None = None
 
         try:
-            async for event in self.agent.translate_stream(content, context, direction, model):
+            async for event in self.agent.translate_stream(content, context, direction):
                 # 捕获最终结果用于保存
                 if event.get("event") == "message_done":
                     data = event.get("data", {})
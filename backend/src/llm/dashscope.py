@@ -15,13 +15,13 @@ from core.logging import get_logger
 logger = get_logger(__name__)
 
 
-def create_dashscope_llm() -> BaseChatModel:
-    """创建 DashScope LLM 实例（带重试机制）"""
+def create_dashscope_llm(model_name: str | None = None) -> BaseChatModel:
+    """创建 DashScope LLM 实例（带重试机制），未指定 model_name 时使用配置的主模型"""
     llm_config = config_manager.llm.dashscope
 
     # ChatTongyi 的参数名与 pyright 识别不一致，使用 type: ignore
     client = ChatTongyi(
-        model=llm_config.model_name,
+        model=model_name or llm_config.model_name,
         dashscope_api_key=llm_config.api_key,  # type: ignore[call-arg]
         temperature=llm_config.temperature,  # type: ignore[call-arg]
         max_tokens=llm_config.max_tokens,  # type: ignore[call-arg]
@@ -47,3 +47,13 @@ def create_dashscope_llm() -> BaseChatModel:
             stop_after_attempt=3,
         ),
     )
+
+
+def create_dashscope_draft_llm() -> BaseChatModel | None:
+    """创建短文本翻译使用的草稿模型，未配置 draft_model_name 时返回 None"""
+    draft_model_name = config_manager.llm.dashscope.draft_model_name
+    if not draft_model_name:
+        logger.info("草稿模型未启用")
+        return None
+    logger.info("草稿模型已启用：%s", draft_model_name)
+    return create_dashscope_llm(draft_model_name)
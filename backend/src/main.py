@@ -24,6 +24,7 @@ from core.cache.redis_service import redis_service
 from core.database.session import close_db_engines, initialize_db_engines, run_migrations
 from core.logging import configure_logging, get_bootstrap_logger, get_startup_logger
 from domain.translate.api.routes import router as translate_router
+from domain.translate.graph.checkpoint import checkpoint_pool
 
 
 # 静态文件目录
@@ -52,6 +53,10 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     await run_migrations()
     startup_logger.info("数据库迁移完成")
 
+    if config_manager.database.checkpoint_enabled:
+        await checkpoint_pool.open()
+        startup_logger.info("Checkpoint 连接池初始化完成")
+
     container = AppContainer()
     container.wire(modules=["domain.translate.api.routes"])
     _app.state.container = container
@@ -66,6 +71,8 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     # await redis_service().close()
     startup_logger.info("Redis 连接已关闭")
 
+    await checkpoint_pool.close()
+
     await close_db_engines()
     startup_logger.info("workTranslationAgent 已关闭")
 
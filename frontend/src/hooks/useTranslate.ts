@@ -59,9 +59,11 @@ export function useTranslate() {
       }
 
       case 'translation_start':
+        // 草稿模型译文未通过校验时会再次开始翻译，需清空已输出的内容
         setState((prev) => ({
           ...prev,
           direction: (event.data as { direction: string }).direction,
+          content: '',
         }))
         break
 